@@ -8,25 +8,45 @@ across different Claude surfaces (Claude.ai, API, Claude Code).
 
 import argparse
 import json
+import os
 import shutil
 import sys
+import time
 import zipfile
-from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, Any, Optional, Tuple
 
 from skill_utils import (
     ValidationResult,
     find_skill_file,
-    parse_skill_file,
-    read_file_safe,
+    read_skill_frontmatter,
     format_path,
+    has_any_entry,
     SkillError,
     SkillPackagingError,
 )
 
 from validate_skill import validate_skill
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize obj as indented JSON, using orjson when it is installed.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        UTF-8 encoded JSON with two-space indentation
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
 
 def create_manifest(
     skill_dir: Path, frontmatter: Dict[str, Any]
@@ -50,7 +70,7 @@ def create_manifest(
         "name": frontmatter.get("name", ""),
         "description": frontmatter.get("description", ""),
         "version": "1.0.0",
-        "packaged_at": datetime.utcnow().isoformat() + "Z",
+        "packaged_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
         "format": "claude-skill",
         "format_version": "1.0",
     }
@@ -65,62 +85,187 @@ def create_manifest(
     scripts_dir = skill_dir / "scripts"
     references_dir = skill_dir / "references"
 
-    manifest["includes_scripts"] = scripts_dir.exists() and any(
-        scripts_dir.iterdir()
-    )
-    manifest["includes_references"] = references_dir.exists() and any(
-        references_dir.iterdir()
-    )
+    manifest["includes_scripts"] = has_any_entry(scripts_dir)
+    manifest["includes_references"] = has_any_entry(references_dir)
 
     return manifest
 
 
-def collect_files(skill_dir: Path) -> List[Path]:
-    """Collect all files to include in the package.
+def _iter_files(
+    root: str, prefix: str
+) -> Iterator[Tuple[str, os.DirEntry]]:
+    """Recursively yield all files under root with their archive names.
+
+    Uses os.scandir() so file types come from the directory listing rather
+    than a separate stat per entry. Directory symlinks are not followed.
+
+    Args:
+        root: Directory to walk
+        prefix: Archive name prefix for entries under root (e.g. "scripts/")
+
+    Yields:
+        Tuples of (arcname, entry) for files under root
+    """
+    stack = [(root, prefix)]
+    while stack:
+        path, path_prefix = stack.pop()
+        with os.scandir(path) as it:
+            subdirs = []
+            for entry in it:
+                arcname = path_prefix + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append((entry.path, arcname + "/"))
+                elif entry.is_file():
+                    yield arcname, entry
+        # Reversed so directories are visited in listing order
+        stack.extend(reversed(subdirs))
+
+
+def _iter_skill_entries(
+    root: Dict[str, os.DirEntry]
+) -> Iterator[Tuple[str, os.DirEntry]]:
+    """Yield packaged files given the entries at the skill root.
+
+    Args:
+        root: Skill directory entries keyed by name
+
+    Yields:
+        Tuples of (arcname, entry) in package order
+    """
+    # Required: SKILL.md
+    yield "SKILL.md", root["SKILL.md"]
+
+    # Optional: scripts and references directories
+    for name in ("scripts", "references"):
+        entry = root.get(name)
+        if entry is not None and entry.is_dir():
+            yield from _iter_files(entry.path, name + "/")
+
+    # Optional: README.md at skill root
+    readme = root.get("README.md")
+    if readme is not None and readme.is_file():
+        yield "README.md", readme
+
+
+def iter_skill_files(skill_dir: Path) -> Iterator[Tuple[str, os.DirEntry]]:
+    """Iterate over all files to include in the package.
+
+    The skill root is scanned immediately so a missing SKILL.md is reported
+    before any output is written; subdirectories are walked lazily as the
+    iterator is consumed.
 
     Args:
         skill_dir: Path to skill directory
 
     Returns:
-        List of file paths to include
+        Iterator of (arcname, entry) tuples, where arcname is the
+        POSIX-style path relative to skill_dir
 
     Raises:
         SkillPackagingError: If SKILL.md is not found
     """
-    files: List[Path] = []
+    with os.scandir(skill_dir) as it:
+        root = {entry.name: entry for entry in it}
 
-    # Required: SKILL.md
-    skill_file = skill_dir / "SKILL.md"
-    if not skill_file.exists():
+    skill_file = root.get("SKILL.md")
+    if skill_file is None or not skill_file.is_file():
         raise SkillPackagingError(f"SKILL.md not found in {skill_dir}")
-    files.append(skill_file)
 
-    # Optional: scripts directory
-    scripts_dir = skill_dir / "scripts"
-    if scripts_dir.exists() and scripts_dir.is_dir():
-        for file in scripts_dir.rglob("*"):
-            if file.is_file():
-                files.append(file)
+    return _iter_skill_entries(root)
+
+
+# Buffer size for streaming file contents into ZIP entries
+_ZIP_COPY_BUFSIZE = 256 * 1024
+
+# Default zlib level for ZIP packages; skills are mostly small text files,
+# where higher levels cost far more CPU time for little size reduction
+DEFAULT_COMPRESS_LEVEL = 3
+
+# Extensions of already-compressed formats; deflating them again costs
+# CPU time without making the package smaller
+_INCOMPRESSIBLE_SUFFIXES = frozenset(
+    {
+        ".7z",
+        ".bz2",
+        ".gif",
+        ".gz",
+        ".jpeg",
+        ".jpg",
+        ".mp3",
+        ".mp4",
+        ".pdf",
+        ".png",
+        ".webp",
+        ".woff2",
+        ".xz",
+        ".zip",
+        ".zst",
+    }
+)
 
-    # Optional: references directory
-    references_dir = skill_dir / "references"
-    if references_dir.exists() and references_dir.is_dir():
-        for file in references_dir.rglob("*"):
-            if file.is_file():
-                files.append(file)
+def _compress_type(arcname: str) -> int:
+    """Choose the ZIP compression method for an entry.
 
-    # Optional: README.md at skill root
-    readme = skill_dir / "README.md"
-    if readme.exists():
-        files.append(readme)
+    Args:
+        arcname: Name of the entry inside the archive
+
+    Returns:
+        zipfile.ZIP_STORED for already-compressed formats, otherwise
+        zipfile.ZIP_DEFLATED
+    """
+    suffix = os.path.splitext(arcname)[1].lower()
+    if suffix in _INCOMPRESSIBLE_SUFFIXES:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
 
-    return files
+
+def _make_zip_info(arcname: str, st: os.stat_result) -> zipfile.ZipInfo:
+    """Build a ZIP entry header from an existing stat result.
+
+    Args:
+        arcname: Name of the entry inside the archive
+        st: Result of stat() on the source file
+
+    Returns:
+        ZipInfo with timestamp, permissions, and compression method set
+    """
+    date_time = time.localtime(st.st_mtime)[:6]
+    if date_time[0] < 1980:
+        # ZIP timestamps cannot represent dates before 1980
+        date_time = (1980, 1, 1, 0, 0, 0)
+
+    zinfo = zipfile.ZipInfo(arcname, date_time)
+    zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+    zinfo.file_size = st.st_size
+    zinfo.compress_type = _compress_type(arcname)
+    return zinfo
+
+
+def _write_streamed(
+    zf: zipfile.ZipFile, path: str, arcname: str, st: os.stat_result
+) -> None:
+    """Stream a file into a new ZIP entry, compressing inline.
+
+    Args:
+        zf: ZIP file open for writing
+        path: Path of the file to add
+        arcname: Name of the entry inside the archive
+        st: Result of stat() on the file
+    """
+    zinfo = _make_zip_info(arcname, st)
+    # ZipFile.open() only applies the archive's level to entries it
+    # creates itself, so carry it over explicitly
+    zinfo._compresslevel = zf.compresslevel
+    with open(path, "rb") as src:
+        with zf.open(zinfo, "w") as dst:
+            shutil.copyfileobj(src, dst, _ZIP_COPY_BUFSIZE)
 
 
 def package_as_zip(
     skill_dir: Path,
     output_path: Path,
     manifest: Optional[Dict[str, Any]] = None,
+    compress_level: int = DEFAULT_COMPRESS_LEVEL,
 ) -> None:
     """Package skill as a ZIP file.
 
@@ -128,25 +273,32 @@ def package_as_zip(
         skill_dir: Path to skill directory
         output_path: Path for output ZIP file
         manifest: Optional manifest dict to include
+        compress_level: zlib compression level (0-9)
 
     Raises:
         SkillPackagingError: If packaging fails
     """
-    files = collect_files(skill_dir)
+    entries = iter_skill_files(skill_dir)
 
     try:
         with zipfile.ZipFile(
-            output_path, "w", zipfile.ZIP_DEFLATED
+            output_path,
+            "w",
+            zipfile.ZIP_DEFLATED,
+            compresslevel=compress_level,
         ) as zf:
             # Add manifest if provided
             if manifest:
-                manifest_json = json.dumps(manifest, indent=2)
-                zf.writestr("manifest.json", manifest_json)
+                zf.writestr("manifest.json", _dumps(manifest))
 
-            # Add all skill files
-            for file in files:
-                arcname = file.relative_to(skill_dir)
-                zf.write(file, arcname)
+            # Add all skill files as they are found, skipping the archive
+            # itself when it is written inside the skill directory
+            output_st = os.fstat(zf.fp.fileno())
+            for arcname, entry in entries:
+                st = entry.stat()
+                if os.path.samestat(st, output_st):
+                    continue
+                _write_streamed(zf, entry.path, arcname, st)
 
     except Exception as e:
         raise SkillPackagingError(f"Failed to create ZIP: {e}")
@@ -167,7 +319,7 @@ def package_as_directory(
     Raises:
         SkillPackagingError: If packaging fails
     """
-    files = collect_files(skill_dir)
+    files = list(iter_skill_files(skill_dir))
 
     try:
         # Create output directory
@@ -176,15 +328,17 @@ def package_as_directory(
         # Write manifest if provided
         if manifest:
             manifest_file = output_path / "manifest.json"
-            manifest_json = json.dumps(manifest, indent=2)
-            manifest_file.write_text(manifest_json, encoding="utf-8")
+            manifest_file.write_bytes(_dumps(manifest))
+
+        # Create each destination directory once, parents first
+        dests = [output_path / arcname for arcname, _ in files]
+        dirs = {dest.parent for dest in dests} - {output_path}
+        for d in sorted(dirs, key=lambda d: len(d.parts)):
+            d.mkdir(parents=True, exist_ok=True)
 
         # Copy all skill files
-        for file in files:
-            rel_path = file.relative_to(skill_dir)
-            dest = output_path / rel_path
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(file, dest)
+        for (_, entry), dest in zip(files, dests):
+            shutil.copy2(entry.path, dest)
 
     except Exception as e:
         raise SkillPackagingError(f"Failed to create directory: {e}")
@@ -196,6 +350,7 @@ def package_skill(
     format: str = "zip",
     validate: bool = True,
     include_manifest: bool = True,
+    compress_level: int = DEFAULT_COMPRESS_LEVEL,
 ) -> Path:
     """Package a skill for distribution.
 
@@ -205,6 +360,7 @@ def package_skill(
         format: Package format ("zip" or "directory")
         validate: Whether to validate before packaging
         include_manifest: Whether to include manifest.json
+        compress_level: zlib compression level for ZIP packages (0-9)
 
     Returns:
         Path to created package
@@ -223,6 +379,7 @@ def package_skill(
     skill_dir = skill_file.parent
 
     # Validate if requested
+    frontmatter = None
     if validate:
         result = validate_skill(skill_dir, strict=False)
         if not result.is_valid:
@@ -230,10 +387,11 @@ def package_skill(
                 f"Skill validation failed:\n{result}\n\n"
                 "Use --no-validate to skip validation"
             )
+        frontmatter = result.frontmatter
 
-    # Parse skill file for manifest
-    content = read_file_safe(skill_file)
-    frontmatter, _ = parse_skill_file(content)
+    # Parse skill frontmatter for manifest, unless validation already did
+    if frontmatter is None:
+        frontmatter = read_skill_frontmatter(skill_file)
 
     # Create manifest
     manifest = None
@@ -250,7 +408,7 @@ def package_skill(
 
     # Package based on format
     if format == "zip":
-        package_as_zip(skill_dir, output, manifest)
+        package_as_zip(skill_dir, output, manifest, compress_level)
     elif format == "directory":
         package_as_directory(skill_dir, output, manifest)
     else:
@@ -284,6 +442,9 @@ Examples:
 
   # Package without manifest
   %(prog)s path/to/skill/ --no-manifest
+
+  # Smallest ZIP at the cost of packaging time
+  %(prog)s path/to/skill/ --compress-level 9
         """,
     )
 
@@ -320,6 +481,18 @@ Examples:
         help="Do not include manifest.json",
     )
 
+    parser.add_argument(
+        "--compress-level",
+        type=int,
+        choices=range(10),
+        default=DEFAULT_COMPRESS_LEVEL,
+        metavar="N",
+        help=(
+            "ZIP compression level, 0-9 "
+            f"(default: {DEFAULT_COMPRESS_LEVEL})"
+        ),
+    )
+
     parser.add_argument(
         "-v",
         "--verbose",
@@ -339,6 +512,7 @@ Examples:
             format=args.format,
             validate=not args.no_validate,
             include_manifest=not args.no_manifest,
+            compress_level=args.compress_level,
         )
 
         print(f"✅ Successfully packaged to: {format_path(output_path)}")
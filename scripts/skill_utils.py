@@ -5,6 +5,8 @@ Shared utilities for Claude skill creation, validation, and packaging.
 This module provides common functionality used across the skill-creator tools.
 """
 
+import mmap
+import os
 import re
 import sys
 from pathlib import Path
@@ -20,6 +22,34 @@ except ImportError:
     sys.exit(1)
 
 
+# Frontmatter block between --- delimiters, followed by the body
+_FRONTMATTER_RE = re.compile(r"^---\n(.*?)\n---\n(.*)$", re.DOTALL)
+
+# Lowercase letters, numbers, and hyphens only
+_NAME_RE = re.compile(r"^[a-z0-9-]+$")
+
+# Anything that looks like an XML/HTML tag
+_XML_RE = re.compile(r"<[^>]+>")
+
+# A flat, single-line "key: value" frontmatter entry
+_FLAT_ENTRY_RE = re.compile(r"([A-Za-z_][A-Za-z0-9_-]*):[ ]+(.*?)[ ]*")
+
+# Characters that give a leading plain scalar a non-string meaning in YAML
+# (indicators, numbers, timestamps, special floats, null)
+_YAML_LEADING_CHARS = frozenset("-?:,[]{}#&*!|>'\"%@`<=~+.0123456789")
+
+# Plain scalars that YAML resolves to booleans or null
+_YAML_SPECIAL_WORDS = frozenset(
+    {"yes", "no", "true", "false", "on", "off", "null"}
+)
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Files larger than this are decoded straight from a memory map
+_MMAP_MIN_SIZE = 256 * 1024
+
+
 class SkillError(Exception):
     """Base exception for skill-related errors."""
 
@@ -38,15 +68,25 @@ class SkillPackagingError(SkillError):
     pass
 
 
-def safe_path(base: Path, user_input: str) -> Path:
+def safe_path(
+    base: Path, user_input: str, follow_symlinks: bool = True
+) -> Path:
     """Safely resolve a path relative to base, preventing traversal attacks.
 
+    By default symlinks are resolved before checking containment, so a link
+    inside base that points elsewhere is rejected. For trees known to
+    contain no untrusted symlinks, follow_symlinks=False checks only the
+    normalized path string, which blocks ".." and absolute-path escapes
+    without touching the filesystem.
+
     Args:
         base: The base directory path
         user_input: User-provided path component
+        follow_symlinks: Resolve symlinks before checking containment
+            (default True); pass False only for trusted trees
 
     Returns:
-        Resolved path that is guaranteed to be within base
+        Absolute path that is guaranteed to be within base
 
     Raises:
         ValueError: If path traversal is detected
@@ -60,12 +100,93 @@ def safe_path(base: Path, user_input: str) -> Path:
         ...
         ValueError: Path traversal detected: ../etc/passwd
     """
-    resolved = (base / user_input).resolve()
+    if follow_symlinks:
+        resolved = (base / user_input).resolve()
+        try:
+            resolved.relative_to(base.resolve())
+        except ValueError:
+            raise ValueError(f"Path traversal detected: {user_input}")
+        return resolved
+
+    base_str = os.path.abspath(base)
+    joined = os.path.normpath(os.path.join(base_str, user_input))
     try:
-        resolved.relative_to(base.resolve())
+        inside = os.path.commonpath([joined, base_str]) == base_str
     except ValueError:
+        # Paths on different drives (Windows)
+        inside = False
+    if not inside:
         raise ValueError(f"Path traversal detected: {user_input}")
-    return resolved
+    return Path(joined)
+
+
+def _fast_scalar(value: str) -> Optional[str]:
+    """Interpret a single-line YAML scalar if it is unambiguously a string.
+
+    Args:
+        value: Scalar text with surrounding spaces stripped
+
+    Returns:
+        The string value, or None if YAML could read it differently
+    """
+    if not value or not value.isprintable():
+        return None
+
+    if value[0] in "'\"":
+        quote, inner = value[0], value[1:-1]
+        if len(value) < 2 or value[-1] != quote or quote in inner:
+            return None
+        if quote == '"' and "\\" in inner:
+            return None
+        return inner
+
+    if (
+        value[0] in _YAML_LEADING_CHARS
+        or value.endswith(":")
+        or ": " in value
+        or " #" in value
+        or value.lower() in _YAML_SPECIAL_WORDS
+    ):
+        return None
+
+    return value
+
+
+def _fast_frontmatter(frontmatter_str: str) -> Optional[Dict[str, str]]:
+    """Parse frontmatter made only of flat "key: value" string entries.
+
+    This covers typical SKILL.md frontmatter without running a full YAML
+    parser. Anything else (nesting, lists, block scalars, comments,
+    non-string values) returns None so the caller can fall back to YAML.
+
+    Args:
+        frontmatter_str: Text between the --- delimiters
+
+    Returns:
+        Dictionary of entries, or None if YAML parsing is needed
+
+    Examples:
+        >>> _fast_frontmatter("name: test\ndescription: 'A skill'")
+        {'name': 'test', 'description': 'A skill'}
+        >>> _fast_frontmatter("tools:\n  - Read") is None
+        True
+    """
+    frontmatter: Dict[str, str] = {}
+    for line in frontmatter_str.split("\n"):
+        if not line:
+            continue
+        match = _FLAT_ENTRY_RE.fullmatch(line)
+        if not match:
+            return None
+        key, value = match.groups()
+        if key.lower() in _YAML_SPECIAL_WORDS:
+            return None
+        scalar = _fast_scalar(value)
+        if scalar is None:
+            return None
+        frontmatter[key] = scalar
+
+    return frontmatter or None
 
 
 def parse_skill_file(content: str) -> Tuple[Dict[str, Any], str]:
@@ -97,7 +218,7 @@ def parse_skill_file(content: str) -> Tuple[Dict[str, Any], str]:
         )
 
     # Match frontmatter between --- delimiters
-    match = re.match(r"^---\n(.*?)\n---\n(.*)$", content, re.DOTALL)
+    match = _FRONTMATTER_RE.match(content)
     if not match:
         raise SkillValidationError(
             "Invalid frontmatter format. Must be:\n"
@@ -110,10 +231,12 @@ def parse_skill_file(content: str) -> Tuple[Dict[str, Any], str]:
 
     frontmatter_str, body = match.groups()
 
-    try:
-        frontmatter = yaml.safe_load(frontmatter_str)
-    except yaml.YAMLError as e:
-        raise SkillValidationError(f"Invalid YAML in frontmatter: {e}")
+    frontmatter = _fast_frontmatter(frontmatter_str)
+    if frontmatter is None:
+        try:
+            frontmatter = yaml.load(frontmatter_str, Loader=_YAML_LOADER)
+        except yaml.YAMLError as e:
+            raise SkillValidationError(f"Invalid YAML in frontmatter: {e}")
 
     if not isinstance(frontmatter, dict):
         raise SkillValidationError(
@@ -147,7 +270,7 @@ def validate_skill_name(name: str) -> Tuple[bool, str]:
         return False, f"Skill name too long ({len(name)} chars, max 64)"
 
     # Check for lowercase, numbers, and hyphens only
-    if not re.match(r"^[a-z0-9-]+$", name):
+    if not _NAME_RE.match(name):
         return (
             False,
             "Skill name must be lowercase with hyphens only (a-z, 0-9, -)",
@@ -194,7 +317,7 @@ def validate_skill_description(description: str) -> Tuple[bool, str]:
         )
 
     # Check for XML tags
-    if re.search(r"<[^>]+>", description):
+    if _XML_RE.search(description):
         return False, "Description cannot contain XML tags"
 
     return True, ""
@@ -230,13 +353,45 @@ def find_skill_file(path: Path) -> Optional[Path]:
     return None
 
 
+def has_any_entry(path: Path) -> bool:
+    """Check whether a directory exists and contains at least one entry.
+
+    Uses a single os.scandir() call instead of separate exists() and
+    iterdir() probes.
+
+    Args:
+        path: Directory path to check
+
+    Returns:
+        True if path is a directory with any entries, False otherwise
+
+    Examples:
+        >>> from pathlib import Path
+        >>> has_any_entry(Path("path/to/skill/scripts"))
+        True
+        >>> has_any_entry(Path("path/to/missing"))
+        False
+    """
+    try:
+        with os.scandir(path) as it:
+            return next(it, None) is not None
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
+
 class ValidationResult:
-    """Result of a validation check with errors and warnings."""
+    """Result of a validation check with errors and warnings.
+
+    When SKILL.md was parsed successfully, its frontmatter and body are
+    kept so callers do not need to read and parse the file again.
+    """
 
     def __init__(self):
         """Initialize an empty validation result."""
         self.errors: list[str] = []
         self.warnings: list[str] = []
+        self.frontmatter: Optional[Dict[str, Any]] = None
+        self.body: Optional[str] = None
 
     def add_error(self, message: str) -> None:
         """Add an error message.
@@ -278,24 +433,19 @@ class ValidationResult:
         Returns:
             Formatted string with errors and warnings
         """
-        lines = []
+        parts = []
 
         if self.errors:
-            lines.append("❌ Errors:")
-            for error in self.errors:
-                lines.append(f"  - {error}")
+            parts.append("❌ Errors:")
+            parts.extend("  - " + error for error in self.errors)
 
         if self.warnings:
-            if lines:
-                lines.append("")
-            lines.append("⚠️  Warnings:")
-            for warning in self.warnings:
-                lines.append(f"  - {warning}")
+            if parts:
+                parts.append("")
+            parts.append("⚠️  Warnings:")
+            parts.extend("  - " + warning for warning in self.warnings)
 
-        if not lines:
-            lines.append("✅ Validation passed")
-
-        return "\n".join(lines)
+        return "\n".join(parts) or "✅ Validation passed"
 
     def __bool__(self) -> bool:
         """Allow using ValidationResult in boolean context.
@@ -306,6 +456,34 @@ class ValidationResult:
         return self.is_valid
 
 
+def _read_text_mmap(file_path: Path, size: int) -> str:
+    """Decode a UTF-8 file from a memory map without an extra bytes copy.
+
+    Args:
+        file_path: Path to file to read
+        size: Size of the file in bytes
+
+    Returns:
+        File contents with newlines translated as in text mode
+
+    Raises:
+        OSError: If the file cannot be opened or mapped
+        ValueError: If the file cannot be mapped at the given size
+        UnicodeDecodeError: If the file is not valid UTF-8
+    """
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as mm:
+            content = str(mm, "utf-8")
+    finally:
+        os.close(fd)
+
+    # Match read_text(), which translates \r\n and \r to \n
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
 def read_file_safe(file_path: Path, max_size: int = 10 * 1024 * 1024) -> str:
     """Safely read a file with size limit and error handling.
 
@@ -337,6 +515,15 @@ def read_file_safe(file_path: Path, max_size: int = 10 * 1024 * 1024) -> str:
             f"File too large: {size} bytes (max {max_size} bytes)"
         )
 
+    if size > _MMAP_MIN_SIZE:
+        try:
+            return _read_text_mmap(file_path, size)
+        except UnicodeDecodeError:
+            raise SkillError(f"File is not valid UTF-8: {file_path}")
+        except (OSError, ValueError):
+            # Fall back to a regular read below
+            pass
+
     try:
         return file_path.read_text(encoding="utf-8")
     except UnicodeDecodeError:
@@ -345,6 +532,84 @@ def read_file_safe(file_path: Path, max_size: int = 10 * 1024 * 1024) -> str:
         raise SkillError(f"Error reading file {file_path}: {e}")
 
 
+def read_file_head(
+    file_path: Path,
+    limit: int = 64 * 1024,
+    max_size: int = 10 * 1024 * 1024,
+) -> str:
+    """Read the beginning of a UTF-8 text file.
+
+    The whole file is held to the same size limit as read_file_safe(),
+    but only the characters actually read are checked for valid UTF-8;
+    the rest of the file is not decoded.
+
+    Args:
+        file_path: Path to file to read
+        limit: Maximum number of characters to read (default 64K)
+        max_size: Maximum file size in bytes (default 10MB)
+
+    Returns:
+        Up to limit characters from the start of the file
+
+    Raises:
+        SkillError: If file cannot be read or is too large
+
+    Examples:
+        >>> from pathlib import Path
+        >>> head = read_file_head(Path("SKILL.md"), limit=3)
+        >>> head
+        '---'
+    """
+    if not file_path.exists():
+        raise SkillError(f"File not found: {file_path}")
+
+    if not file_path.is_file():
+        raise SkillError(f"Not a file: {file_path}")
+
+    size = file_path.stat().st_size
+    if size > max_size:
+        raise SkillError(
+            f"File too large: {size} bytes (max {max_size} bytes)"
+        )
+
+    try:
+        with open(file_path, encoding="utf-8") as f:
+            return f.read(limit)
+    except UnicodeDecodeError:
+        raise SkillError(f"File is not valid UTF-8: {file_path}")
+    except Exception as e:
+        raise SkillError(f"Error reading file {file_path}: {e}")
+
+
+def read_skill_frontmatter(
+    skill_file: Path, head_size: int = 64 * 1024
+) -> Dict[str, Any]:
+    """Read and parse only the frontmatter of a SKILL.md file.
+
+    Only the first head_size characters are read unless the frontmatter
+    does not end within them, in which case the whole file is read. The
+    file size limit always applies, but text after the part that was read
+    is not checked for valid UTF-8; use validate_skill() for that.
+
+    Args:
+        skill_file: Path to SKILL.md
+        head_size: Number of characters to read up front (default 64K)
+
+    Returns:
+        Parsed frontmatter dictionary
+
+    Raises:
+        SkillError: If the file cannot be read
+        SkillValidationError: If frontmatter is missing or invalid
+    """
+    content = read_file_head(skill_file, head_size)
+    if len(content) == head_size and not _FRONTMATTER_RE.match(content):
+        content = read_file_safe(skill_file)
+
+    frontmatter, _ = parse_skill_file(content)
+    return frontmatter
+
+
 def format_path(path: Path, relative_to: Optional[Path] = None) -> str:
     """Format a path for display, optionally as relative path.
 
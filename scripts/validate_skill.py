@@ -7,9 +7,11 @@ specifications for name, description, frontmatter format, and content.
 """
 
 import argparse
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, List, Optional
 
 from skill_utils import (
     ValidationResult,
@@ -19,9 +21,18 @@ from skill_utils import (
     validate_skill_name,
     validate_skill_description,
     format_path,
+    has_any_entry,
     SkillError,
 )
 
+# Keywords that indicate recommended SKILL.md sections, mapped to the
+# section description used in warnings
+_RECOMMENDED_SECTIONS = {
+    "when to use": "when to use this skill",
+    "instruction": "step-by-step instructions",
+    "example": "concrete examples",
+}
+
 
 def validate_skill(
     skill_path: Path, strict: bool = False
@@ -65,6 +76,9 @@ def validate_skill(
         result.add_error(str(e))
         return result
 
+    result.frontmatter = frontmatter
+    result.body = body
+
     # Validate required fields
     if "name" not in frontmatter:
         result.add_error('Required field "name" missing from frontmatter')
@@ -109,13 +123,7 @@ def validate_skill(
 
     # Check for common sections
     body_lower = body.lower()
-    recommended_sections = [
-        ("when to use", "when to use this skill"),
-        ("instruction", "step-by-step instructions"),
-        ("example", "concrete examples"),
-    ]
-
-    for keyword, description in recommended_sections:
+    for keyword, description in _RECOMMENDED_SECTIONS.items():
         if keyword not in body_lower:
             result.add_warning(
                 f"Missing recommended section: {description}"
@@ -159,7 +167,7 @@ def validate_skill(
     scripts_dir = skill_dir / "scripts"
     references_dir = skill_dir / "references"
 
-    if scripts_dir.exists():
+    if has_any_entry(scripts_dir):
         python_files = list(scripts_dir.glob("*.py"))
         if python_files:
             # Check for __init__.py
@@ -188,6 +196,130 @@ def validate_skill(
     return result
 
 
+def find_skill_dirs(root: Path) -> List[Path]:
+    """Find skill directories (those containing SKILL.md) under root.
+
+    Hidden directories are skipped, and directories inside a skill are not
+    searched further.
+
+    Args:
+        root: Directory to search
+
+    Returns:
+        Sorted list of skill directory paths
+
+    Examples:
+        >>> from pathlib import Path
+        >>> find_skill_dirs(Path("."))
+        [PosixPath('skill-creator'), PosixPath('template-skill')]
+    """
+    skill_dirs: List[Path] = []
+    stack = [str(root)]
+    while stack:
+        path = stack.pop()
+        with os.scandir(path) as it:
+            entries = list(it)
+
+        if any(e.name == "SKILL.md" and e.is_file() for e in entries):
+            skill_dirs.append(Path(path))
+            continue
+
+        stack.extend(
+            e.path
+            for e in entries
+            if e.is_dir(follow_symlinks=False) and not e.name.startswith(".")
+        )
+
+    return sorted(skill_dirs)
+
+
+def _validate_without_body(path: Path, strict: bool) -> ValidationResult:
+    """Validate a skill, dropping the SKILL.md body from the result.
+
+    Keeps batch results small when they are sent back from worker
+    processes.
+
+    Args:
+        path: Skill directory or SKILL.md file to validate
+        strict: Enable strict mode (warnings become errors)
+
+    Returns:
+        ValidationResult with body set to None
+    """
+    result = validate_skill(path, strict)
+    result.body = None
+    return result
+
+
+def validate_many(
+    paths: Iterable[Path], strict: bool = False
+) -> Dict[Path, ValidationResult]:
+    """Validate several skills in parallel worker processes.
+
+    Args:
+        paths: Skill directories or SKILL.md files to validate
+        strict: Enable strict mode (warnings become errors)
+
+    Returns:
+        Dictionary mapping each path to its ValidationResult, in the
+        order the paths were given. Results do not include the SKILL.md
+        body.
+
+    Examples:
+        >>> from pathlib import Path
+        >>> results = validate_many([Path("skill-a"), Path("skill-b")])
+        >>> all(results.values())
+        True
+    """
+    paths = list(paths)
+    workers = min(os.cpu_count() or 1, len(paths))
+    if workers <= 1:
+        return {path: _validate_without_body(path, strict) for path in paths}
+
+    results: Dict[Path, ValidationResult] = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(_validate_without_body, path, strict): path
+            for path in paths
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+
+    return {path: results[path] for path in paths}
+
+
+def report_result(
+    result: ValidationResult, strict: bool = False, quiet: bool = False
+) -> int:
+    """Print a validation result and return the matching exit code.
+
+    Args:
+        result: Result to report
+        strict: Whether strict mode was enabled
+        quiet: Only show errors, not warnings
+
+    Returns:
+        Exit code: 0 for success, 1 for validation failure
+    """
+    if result.errors:
+        print(result)
+        return 1
+
+    if result.warnings and not quiet:
+        print(result)
+        if not strict:
+            print("\n✅ Validation passed (with warnings)")
+            return 0
+        else:
+            print("\n❌ Validation failed (strict mode)")
+            return 1
+
+    if not quiet:
+        print("✅ Validation passed")
+
+    return 0
+
+
 def main() -> int:
     """Main entry point for the validator.
 
@@ -210,13 +342,26 @@ Examples:
 
   # Quiet mode (only errors)
   %(prog)s --quiet path/to/skill/
+
+  # Validate every skill under a directory
+  %(prog)s --recursive path/to/skills/
         """,
     )
 
     parser.add_argument(
         "skill_path",
         type=Path,
-        help="Path to skill directory or SKILL.md file",
+        help=(
+            "Path to skill directory or SKILL.md file "
+            "(with --recursive, a directory to search)"
+        ),
+    )
+
+    parser.add_argument(
+        "-r",
+        "--recursive",
+        action="store_true",
+        help="Validate all skills found under skill_path",
     )
 
     parser.add_argument(
@@ -241,6 +386,9 @@ Examples:
 
     args = parser.parse_args()
 
+    if args.recursive:
+        return main_recursive(args)
+
     # Validate the skill
     try:
         result = validate_skill(args.skill_path, strict=args.strict)
@@ -253,23 +401,53 @@ Examples:
         print(f"Validating: {format_path(args.skill_path)}")
         print()
 
-    if result.errors:
-        print(result)
-        return 1
+    return report_result(result, strict=args.strict, quiet=args.quiet)
 
-    if result.warnings and not args.quiet:
-        print(result)
-        if not args.strict:
-            print("\n✅ Validation passed (with warnings)")
-            return 0
-        else:
-            print("\n❌ Validation failed (strict mode)")
-            return 1
 
-    if not args.quiet:
-        print("✅ Validation passed")
+def main_recursive(args: argparse.Namespace) -> int:
+    """Validate every skill under args.skill_path.
 
-    return 0
+    Args:
+        args: Parsed command-line arguments
+
+    Returns:
+        Exit code: 0 for success, 1 for validation failure, 2 for error
+    """
+    try:
+        skill_dirs = find_skill_dirs(args.skill_path)
+        if not skill_dirs:
+            print(
+                f"Error: No skills found under {format_path(args.skill_path)}",
+                file=sys.stderr,
+            )
+            return 2
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    if args.verbose:
+        print(
+            f"Validating {len(skill_dirs)} skills under: "
+            f"{format_path(args.skill_path)}"
+        )
+        print()
+
+    try:
+        results = validate_many(skill_dirs, strict=args.strict)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    exit_code = 0
+    for skill_dir, result in results.items():
+        if result.errors or not args.quiet:
+            print(f"{format_path(skill_dir)}:")
+        code = report_result(result, strict=args.strict, quiet=args.quiet)
+        if result.errors or not args.quiet:
+            print()
+        exit_code = max(exit_code, code)
+
+    return exit_code
 
 
 if __name__ == "__main__":